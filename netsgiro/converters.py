@@ -1,6 +1,8 @@
 """Custom converters for :mod:`attrs`."""
 import datetime
-from typing import Any, Callable, Optional, TypeVar, Union
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
 
 from netsgiro.enums import (
     AssignmentType,
@@ -11,6 +13,7 @@ from netsgiro.enums import (
 )
 
 T = TypeVar('T')
+E = TypeVar('E', bound=IntEnum)
 
 
 def to_int_or_none(value: Union[None, int, str]) -> Optional[int]:
@@ -57,42 +60,97 @@ def to_safe_str_or_none(value: Optional[str]) -> Optional[str]:
     """Convert input to cleaned string or None."""
     if value is None:
         return None
-    v = str(value.strip()).replace('\r', '').replace('\n', '')
-    return v or None
+    if '\r' in value or '\n' in value:
+        value = value.replace('\r', '').replace('\n', '')
+    return value.strip() or None
+
+
+def _enum_members_by_value(enum_cls: Type[E]) -> Dict[Union[int, str], E]:
+    """Map each member's value, as int and as zero-padded string, to the member.
+
+    The enum converters look up their input in these maps before falling
+    back to ``EnumClass(int(value))``, which skips both ``int()`` and the enum
+    lookup for the values found in OCR files.
+    """
+    members: Dict[Union[int, str], E] = {}
+    for member in enum_cls:
+        members[member.value] = member
+        members[str(member.value)] = member
+        members[f'{member.value:02d}'] = member
+    return members
+
+
+_SERVICE_CODES = _enum_members_by_value(ServiceCode)
+_ASSIGNMENT_TYPES = _enum_members_by_value(AssignmentType)
+_TRANSACTION_TYPES = _enum_members_by_value(TransactionType)
+_RECORD_TYPES = _enum_members_by_value(RecordType)
+_AVTALEGIRO_REGISTRATION_TYPES = _enum_members_by_value(AvtaleGiroRegistrationType)
 
 
 def to_service_code(value: Union[ServiceCode, int, str]) -> ServiceCode:
     """Convert input to ServiceCode."""
-    return ServiceCode(int(value))
+    try:
+        return _SERVICE_CODES[value]
+    except KeyError:
+        return ServiceCode(int(value))
 
 
 def to_assignment_type(value: Union[AssignmentType, int, str]) -> AssignmentType:
     """Convert input to AssignmentType."""
-    return AssignmentType(int(value))
+    try:
+        return _ASSIGNMENT_TYPES[value]
+    except KeyError:
+        return AssignmentType(int(value))
 
 
 def to_transaction_type(value: Union[TransactionType, int, str]) -> TransactionType:
     """Convert input to TransactionType."""
-    return TransactionType(int(value))
+    try:
+        return _TRANSACTION_TYPES[value]
+    except KeyError:
+        return TransactionType(int(value))
 
 
 def to_record_type(value: Union[RecordType, int, str]) -> RecordType:
     """Convert input to RecordType."""
-    return RecordType(int(value))
+    try:
+        return _RECORD_TYPES[value]
+    except KeyError:
+        return RecordType(int(value))
 
 
 def to_avtalegiro_registration_type(
     value: Union[AvtaleGiroRegistrationType, int, str]
 ) -> AvtaleGiroRegistrationType:
     """Convert input to AvtaleGiroRegistrationType."""
-    return AvtaleGiroRegistrationType(int(value))
+    try:
+        return _AVTALEGIRO_REGISTRATION_TYPES[value]
+    except KeyError:
+        return AvtaleGiroRegistrationType(int(value))
+
+
+@lru_cache(maxsize=2048)
+def _parse_ddmmyy(value: str) -> datetime.date:
+    """Parse a ``DDMMYY`` string into a date.
+
+    Files tend to repeat the same few dates on every transaction, and dates
+    are immutable, so results are cached.
+
+    Two-digit years are resolved like :func:`time.strptime` does: 69-99 maps
+    to 1969-1999 and 00-68 maps to 2000-2068.
+    """
+    if len(value) != 6 or not (value.isascii() and value.isdigit()):
+        raise ValueError(f"time data {value!r} does not match format '%d%m%y'")
+    year = int(value[4:6])
+    year += 1900 if year >= 69 else 2000
+    return datetime.date(year, int(value[2:4]), int(value[0:2]))
 
 
 def to_date(value: Union[datetime.date, str]) -> datetime.date:
     """Convert input to date."""
     if isinstance(value, datetime.date):
         return value
-    return datetime.datetime.strptime(value, '%d%m%y').date()
+    return _parse_ddmmyy(value)
 
 
 def to_date_or_none(value: Optional[Union[datetime.date, str]]) -> Optional[datetime.date]:
@@ -101,16 +159,17 @@ def to_date_or_none(value: Optional[Union[datetime.date, str]]) -> Optional[date
         return value
     if value is None or value == '000000':
         return None
-    return datetime.datetime.strptime(value, '%d%m%y').date()
+    return _parse_ddmmyy(value)
+
+
+_BOOLS: Dict[str, bool] = {'J': True, 'N': False}
 
 
 def to_bool(value: Union[bool, str]) -> bool:
     """Convert input to bool."""
     if isinstance(value, bool):
         return value
-    if value == 'J':
-        return True
-    elif value == 'N':
-        return False
-    else:
-        raise ValueError(f"Expected 'J' or 'N', got {value!r}")
+    try:
+        return _BOOLS[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"Expected 'J' or 'N', got {value!r}") from None
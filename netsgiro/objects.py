@@ -3,9 +3,9 @@
 import datetime
 from collections import OrderedDict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, List, Optional
+from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional
 from typing import OrderedDict as OrderedDictType
-from typing import TypeVar, Union, cast
+from typing import Tuple, TypeVar, Union, cast
 
 from attrs import Factory, define, field
 from attrs.validators import instance_of, optional
@@ -16,7 +16,7 @@ from netsgiro.converters import (
     to_service_code,
     to_transaction_type,
 )
-from netsgiro.enums import AssignmentType, ServiceCode, TransactionType
+from netsgiro.enums import AssignmentType, RecordType, ServiceCode, TransactionType
 from netsgiro.records import (
     AssignmentEnd,
     AssignmentStart,
@@ -53,6 +53,16 @@ TransactionAmountItems = Union[
 # Record or Record subclasses
 R = TypeVar('R', bound='Record')
 
+# Assignment types making up an AvtaleGiro payment request transmission
+_PAYMENT_REQUEST_ASSIGNMENT_TYPES = frozenset(
+    {AssignmentType.TRANSACTIONS, AssignmentType.AVTALEGIRO_CANCELLATIONS}
+)
+
+# OCR Giro transaction types carrying a TransactionAmountItem3 text record
+_OCR_GIRO_TEXT_TRANSACTION_TYPES = frozenset(
+    {TransactionType.REVERSING_WITH_TEXT, TransactionType.PURCHASE_WITH_TEXT}
+)
+
 
 @define
 class Transmission:
@@ -103,32 +113,35 @@ class Transmission:
 
     @staticmethod
     def _get_assignments(records: List[R]) -> List['Assignment']:
-        assignments: OrderedDictType[str, List[R]] = OrderedDict()
+        assignments: List[List[R]] = []
 
-        current_assignment_number = None
+        current_assignment: Optional[List[R]] = None
         for record in records:
-            if isinstance(record, AssignmentStart):
-                current_assignment_number = record.assignment_number
-                assignments[current_assignment_number] = []
-            if current_assignment_number is None:
+            # Dispatch on the record type tag rather than walking the MRO
+            # with isinstance() twice per record
+            record_type = getattr(record, 'RECORD_TYPE', None)
+            if record_type is RecordType.ASSIGNMENT_START:
+                current_assignment = []
+                assignments.append(current_assignment)
+            if current_assignment is None:
                 raise ValueError(f'Expected AssignmentStart record, got {record!r}')
-            assignments[current_assignment_number].append(record)
-            if isinstance(record, AssignmentEnd):
-                current_assignment_number = None
+            current_assignment.append(record)
+            if record_type is RecordType.ASSIGNMENT_END:
+                current_assignment = None
 
-        return [Assignment.from_records(rs) for rs in assignments.values()]
+        return [Assignment.from_records(rs) for rs in assignments]
 
     def to_ocr(self) -> str:
         """Convert the transmission to an OCR string."""
-        lines = [record.to_ocr() for record in self.to_records()]
-        return '\n'.join(lines)
+        return '\n'.join([record.to_ocr() for record in self.to_records()])
 
-    def to_records(self) -> Iterable['Record']:
+    def to_records(self) -> List['Record']:
         """Convert the transmission to a list of records."""
-        yield self._get_start_record()
+        records: List['Record'] = [self._get_start_record()]
         for assignment in self.assignments:
-            yield from assignment.to_records()
-        yield self._get_end_record()
+            records.extend(assignment.to_records())
+        records.append(self._get_end_record())
+        return records
 
     def _get_start_record(self) -> 'Record':
         return TransmissionStart(
@@ -141,11 +154,7 @@ class Transmission:
     def _get_end_record(self) -> 'Record':
         avtalegiro_payment_request = all(
             assignment.service_code == ServiceCode.AVTALEGIRO
-            and assignment.type
-            in (
-                AssignmentType.TRANSACTIONS,
-                AssignmentType.AVTALEGIRO_CANCELLATIONS,
-            )
+            and assignment.type in _PAYMENT_REQUEST_ASSIGNMENT_TYPES
             for assignment in self.assignments
         )
         if self.assignments and avtalegiro_payment_request:
@@ -166,7 +175,7 @@ class Transmission:
             service_code=ServiceCode.NONE,
             num_transactions=self.get_num_transactions(),
             num_records=self.get_num_records(),
-            total_amount=int(self.get_total_amount() * 100),
+            total_amount=self._get_total_amount_in_cents(),
             nets_date=date,
         )
 
@@ -207,6 +216,9 @@ class Transmission:
         """Get the total amount from all transactions in the transmission."""
         return Decimal(sum(assignment.get_total_amount() for assignment in self.assignments))
 
+    def _get_total_amount_in_cents(self) -> int:
+        return sum(assignment._get_total_amount_in_cents() for assignment in self.assignments)
+
 
 # Assigment transactions
 TS = List[Union['Transaction', 'Agreement', 'PaymentRequest']]
@@ -317,12 +329,16 @@ class Assignment:
 
         return transactions
 
-    def to_records(self) -> Iterable[Union[AssignmentStart, TransactionAmountItems, AssignmentEnd]]:
+    def to_records(self) -> List['Record']:
         """Convert the assignment to a list of records."""
-        yield self._get_start_record()
+        records: List['Record'] = [self._get_start_record()]
         for transaction in self.transactions:
-            yield from transaction.to_records()
-        yield self._get_end_record()
+            records.extend(transaction.to_records())
+
+        # The transaction records are already built, so count them here
+        # instead of having the end record build them all over again.
+        records.append(self._get_end_record(num_records=len(records) + 1))
+        return records
 
     def _get_start_record(self) -> AssignmentStart:
         return AssignmentStart(
@@ -333,17 +349,18 @@ class Assignment:
             agreement_id=self.agreement_id,
         )
 
-    def _get_end_record(self) -> AssignmentEnd:
+    def _get_end_record(self, num_records: Optional[int] = None) -> AssignmentEnd:
+        earliest, latest = self._get_transaction_date_range()
         if self.service_code == ServiceCode.OCR_GIRO:
             dates = {
                 'nets_date_1': self.date,
-                'nets_date_2': self.get_earliest_transaction_date(),
-                'nets_date_3': self.get_latest_transaction_date(),
+                'nets_date_2': earliest,
+                'nets_date_3': latest,
             }
         elif self.service_code == ServiceCode.AVTALEGIRO:
             dates = {
-                'nets_date_1': self.get_earliest_transaction_date(),
-                'nets_date_2': self.get_latest_transaction_date(),
+                'nets_date_1': earliest,
+                'nets_date_2': latest,
             }
         else:  # pragma: no cover
             raise ValueError(f'Unhandled service code: {self.service_code}')
@@ -352,8 +369,8 @@ class Assignment:
             service_code=self.service_code,
             assignment_type=self.type,
             num_transactions=self.get_num_transactions(),
-            num_records=self.get_num_records(),
-            total_amount=int(self.get_total_amount() * 100),
+            num_records=self.get_num_records() if num_records is None else num_records,
+            total_amount=self._get_total_amount_in_cents(),
             **dates,
         )
 
@@ -387,8 +404,10 @@ class Assignment:
 
         if bank_notification:
             transaction_type = TransactionType.AVTALEGIRO_WITH_BANK_NOTIFICATION
+            text = bank_notification if isinstance(bank_notification, str) else ''
         else:
             transaction_type = TransactionType.AVTALEGIRO_WITH_PAYEE_NOTIFICATION
+            text = ''
 
         return self._add_avtalegiro_transaction(
             transaction_type=transaction_type,
@@ -397,7 +416,7 @@ class Assignment:
             amount=amount,
             reference=reference,
             payer_name=payer_name,
-            bank_notification=bank_notification,
+            text=text,
         )
 
     def add_payment_cancellation(
@@ -433,7 +452,7 @@ class Assignment:
             amount=amount,
             reference=reference,
             payer_name=payer_name,
-            bank_notification=bank_notification,
+            text=bank_notification if isinstance(bank_notification, str) else '',
         )
 
     def _add_avtalegiro_transaction(
@@ -445,11 +464,10 @@ class Assignment:
         amount: Decimal,
         reference: Optional[str] = None,
         payer_name: Optional[str] = None,
-        bank_notification: Union[str, bool] = False,
+        text: str = '',
     ) -> 'PaymentRequest':
-        text = bank_notification if isinstance(bank_notification, str) else ''
         number = self._next_transaction_number
-        self._next_transaction_number += 1
+        self._next_transaction_number = number + 1
 
         transaction = PaymentRequest(
             service_code=self.service_code,
@@ -474,7 +492,7 @@ class Assignment:
 
         Includes the assignment's start and end record.
         """
-        return 2 + sum(len(list(transaction.to_records())) for transaction in self.transactions)
+        return 2 + sum(len(transaction.to_records()) for transaction in self.transactions)
 
     def get_total_amount(self) -> Decimal:
         """Get the total amount from all transactions in the assignment."""
@@ -485,24 +503,27 @@ class Assignment:
                 total += iter_amount
         return total
 
-    def _get_earliest_or_latest_transaction_date(self, latest: bool) -> Optional[datetime.date]:
-        """Get earliest or latest date from the assignment's transactions."""
-        date_: Optional[datetime.date] = None
-        for t in self.transactions:
-            iter_date = getattr(t, 'date', None)
-            if iter_date and (
-                date_ is None or (iter_date > date_ if latest else iter_date < date_)
-            ):
-                date_ = iter_date
-        return date_
+    def _get_total_amount_in_cents(self) -> int:
+        # Agreements have no amount, and count as zero
+        return sum(getattr(t, 'amount_in_cents', 0) for t in self.transactions)
+
+    def _get_transaction_date_range(
+        self,
+    ) -> Tuple[Optional[datetime.date], Optional[datetime.date]]:
+        """Get earliest and latest date from the assignment's transactions."""
+        # Agreements have no date
+        dates = [d for d in (getattr(t, 'date', None) for t in self.transactions) if d]
+        if not dates:
+            return None, None
+        return min(dates), max(dates)
 
     def get_earliest_transaction_date(self) -> Optional[datetime.date]:
         """Get earliest date from the assignment's transactions."""
-        return self._get_earliest_or_latest_transaction_date(latest=False)
+        return self._get_transaction_date_range()[0]
 
     def get_latest_transaction_date(self) -> Optional[datetime.date]:
         """Get latest date from the assignment's transactions."""
-        return self._get_earliest_or_latest_transaction_date(latest=True)
+        return self._get_transaction_date_range()[1]
 
 
 @define
@@ -550,16 +571,18 @@ class Agreement:
             notify=record.notify,
         )
 
-    def to_records(self) -> Iterable[AvtaleGiroAgreement]:
+    def to_records(self) -> List[AvtaleGiroAgreement]:
         """Convert the agreement to a list of records."""
-        yield AvtaleGiroAgreement(
-            service_code=self.service_code,
-            transaction_type=self.TRANSACTION_TYPE,
-            transaction_number=self.number,
-            registration_type=self.registration_type,
-            kid=self.kid,
-            notify=self.notify,
-        )
+        return [
+            AvtaleGiroAgreement(
+                service_code=self.service_code,
+                transaction_type=self.TRANSACTION_TYPE,
+                transaction_number=self.number,
+                registration_type=self.registration_type,
+                kid=self.kid,
+                notify=self.notify,
+            )
+        ]
 
 
 @define
@@ -632,32 +655,40 @@ class PaymentRequest:
 
     def to_records(
         self,
-    ) -> Iterable[Union[TransactionAmountItem1, TransactionAmountItem2, TransactionSpecification]]:
+    ) -> List[Union[TransactionAmountItem1, TransactionAmountItem2, TransactionSpecification]]:
         """Convert the transaction to a list of records."""
-        yield TransactionAmountItem1(
-            service_code=self.service_code,
-            transaction_type=self.type,
-            transaction_number=self.number,
-            nets_date=self.date,
-            amount=self.amount_in_cents,
-            kid=self.kid,
-        )
-        yield TransactionAmountItem2(
-            service_code=self.service_code,
-            transaction_type=self.type,
-            transaction_number=self.number,
-            reference=self.reference,
-            payer_name=self.payer_name,
-        )
-
-        if self.type == TransactionType.AVTALEGIRO_WITH_BANK_NOTIFICATION:
-            yield from TransactionSpecification.from_text(
+        records: List[
+            Union[TransactionAmountItem1, TransactionAmountItem2, TransactionSpecification]
+        ] = [
+            TransactionAmountItem1(
+                service_code=self.service_code,
+                transaction_type=self.type,
+                transaction_number=self.number,
+                nets_date=self.date,
+                amount=self.amount_in_cents,
+                kid=self.kid,
+            ),
+            TransactionAmountItem2(
                 service_code=self.service_code,
                 transaction_type=self.type,
                 transaction_number=self.number,
-                text=self.text,
+                reference=self.reference,
+                payer_name=self.payer_name,
+            ),
+        ]
+
+        if self.type == TransactionType.AVTALEGIRO_WITH_BANK_NOTIFICATION:
+            records.extend(
+                TransactionSpecification.from_text(
+                    service_code=self.service_code,
+                    transaction_type=self.type,
+                    transaction_number=self.number,
+                    text=self.text,
+                )
             )
 
+        return records
+
 
 @define
 class Transaction:
@@ -756,43 +787,46 @@ class Transaction:
             filler=amount_item_2._filler,
         )
 
-    def to_records(self) -> Iterable[TransactionAmountItems]:
+    def to_records(self) -> List[TransactionAmountItems]:
         """Convert the transaction to a list of records."""
-        yield TransactionAmountItem1(
-            service_code=self.service_code,
-            transaction_type=self.type,
-            transaction_number=self.number,
-            nets_date=self.date,
-            amount=self.amount_in_cents,
-            kid=self.kid,
-            centre_id=self.centre_id,
-            day_code=self.day_code,
-            partial_settlement_number=self.partial_settlement_number,
-            partial_settlement_serial_number=self.partial_settlement_serial_number,
-            sign=self.sign,
-        )
-        yield TransactionAmountItem2(
-            service_code=self.service_code,
-            transaction_type=self.type,
-            transaction_number=self.number,
-            reference=self.reference,
-            form_number=self.form_number,
-            bank_date=self.bank_date,
-            debit_account=self.debit_account,
-            filler=self._filler,
-        )
-
-        if self.type in (
-            TransactionType.REVERSING_WITH_TEXT,
-            TransactionType.PURCHASE_WITH_TEXT,
-        ):
-            yield TransactionAmountItem3(
+        records: List[TransactionAmountItems] = [
+            TransactionAmountItem1(
                 service_code=self.service_code,
                 transaction_type=self.type,
                 transaction_number=self.number,
-                text=self.text,
+                nets_date=self.date,
+                amount=self.amount_in_cents,
+                kid=self.kid,
+                centre_id=self.centre_id,
+                day_code=self.day_code,
+                partial_settlement_number=self.partial_settlement_number,
+                partial_settlement_serial_number=self.partial_settlement_serial_number,
+                sign=self.sign,
+            ),
+            TransactionAmountItem2(
+                service_code=self.service_code,
+                transaction_type=self.type,
+                transaction_number=self.number,
+                reference=self.reference,
+                form_number=self.form_number,
+                bank_date=self.bank_date,
+                debit_account=self.debit_account,
+                filler=self._filler,
+            ),
+        ]
+
+        if self.type in _OCR_GIRO_TEXT_TRANSACTION_TYPES:
+            records.append(
+                TransactionAmountItem3(
+                    service_code=self.service_code,
+                    transaction_type=self.type,
+                    transaction_number=self.number,
+                    text=self.text,
+                )
             )
 
+        return records
+
 
 def parse(data: str) -> Transmission:
     """Parse an OCR file into a Transmission object."""
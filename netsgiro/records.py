@@ -2,22 +2,28 @@
 
 import re
 from abc import ABC, abstractmethod
+from operator import attrgetter
+from types import MemberDescriptorType
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
     ClassVar,
+    Dict,
     Iterable,
+    Iterator,
     List,
+    Match,
     Optional,
     Pattern,
     Tuple,
     Type,
     TypeVar,
-    Union,
     cast,
 )
 
 from attr.validators import optional
-from attrs import define, field
+from attrs import NOTHING, define, field, fields
 
 from netsgiro import RecordType, ServiceCode
 from netsgiro.converters import (
@@ -51,17 +57,67 @@ __all__: List[str] = [
     'TransactionAmountItem3',
     'TransactionSpecification',
     'AvtaleGiroAgreement',
+    'iter_parse',
     'parse',
 ]
 
 R = TypeVar('R', bound='Record')
 
+# Per record class and pattern, how to fill in every field of the class: fields
+# with a group in the pattern as (group index, slot setter, converter), and the
+# others as (slot setter, converter, attrs default). The class's
+# __attrs_post_init__, if any, comes last. Subclasses inherit their parent's
+# patterns, so the pattern alone does not identify the class.
+_Setter = Callable[[Any, Any], None]
+_Converter = Optional[Callable[[Any], Any]]
+_FieldConverters = Tuple[
+    Tuple[Tuple[int, _Setter, _Converter], ...],
+    Tuple[Tuple[_Setter, _Converter, Any], ...],
+    Optional[Callable[[Any], None]],
+]
+_FIELD_CONVERTERS: Dict[Tuple[type, Pattern], _FieldConverters] = {}
+
+
+def _get_setter(cls: type, name: str) -> _Setter:
+    """Get a function setting attribute ``name`` on instances of ``cls``.
+
+    Setting values through the slot descriptor directly skips both attrs'
+    on_setattr hooks and the generic attribute lookup. Subclasses declared
+    with ``slots=False`` keep their own fields in ``__dict__`` instead.
+    """
+    slot = getattr(cls, name, None)
+    if isinstance(slot, MemberDescriptorType):
+        return slot.__set__
+    return lambda instance, value: object.__setattr__(instance, name, value)
+
+
+def _ddmmyy(value: Optional['datetime.date']) -> str:
+    """Format a date as ``DDMMYY``, or as zeros if there is no date."""
+    if value is None:
+        return '000000'
+    return f'{value.day:02d}{value.month:02d}{value.year % 100:02d}'
+
+
+_RECORD_CLASSES: Dict[RecordType, Type['Record']] = {}
+# Keyed on the two record type digits as they appear in the line
+_RECORD_CLASSES_BY_CODE: Dict[str, Type['Record']] = {}
+
+
+def _register(cls: Type[R]) -> Type[R]:
+    """Register a record class so :func:`parse` can find it by record type."""
+    _RECORD_CLASSES[cls.RECORD_TYPE] = cls
+    _RECORD_CLASSES_BY_CODE[f'{cls.RECORD_TYPE:02d}'] = cls
+    return cls
+
 
 @define
 class Record(ABC):
     """Record base class."""
 
-    _PATTERNS: ClassVar[List[Pattern]]
+    # Patterns are keyed on the fixed-offset slice of the line that tells
+    # the record formats apart, by default the service code.
+    _PATTERN_KEY: ClassVar[slice] = slice(2, 4)
+    _PATTERNS: ClassVar[Dict[str, Pattern]]
     RECORD_TYPE: ClassVar[RecordType]
 
     service_code: ServiceCode = field(converter=to_service_code)
@@ -69,18 +125,63 @@ class Record(ABC):
     @classmethod
     def from_string(cls: Type[R], line: str) -> R:
         """Parse OCR string into a record object."""
-        for pattern in cls._PATTERNS:
-            matches = pattern.match(line)
-            if matches is not None:
-                return cls(**matches.groupdict())
+        pattern = cls._PATTERNS.get(line[cls._PATTERN_KEY])
+        matches = pattern.fullmatch(line) if pattern is not None else None
+        if matches is None:
+            raise ValueError(f'{line!r} did not match {cls.__name__} record formats')
+        return cls._from_match(matches)
+
+    @classmethod
+    def _from_match(cls: Type[R], matches: Match) -> R:
+        """Build a record from a matched pattern.
+
+        The patterns already enforce every field's length and character set,
+        so only the converters and ``__attrs_post_init__`` are run; the
+        validators are skipped.
+        """
+        key = (cls, matches.re)
+        table = _FIELD_CONVERTERS.get(key)
+        if table is None:
+            table = _FIELD_CONVERTERS[key] = cls._get_field_converters(matches.re)
+        converters, defaults, post_init = table
+        values = matches.groups()
+        record = cls.__new__(cls)
+        for index, set_value, converter in converters:
+            value = values[index]
+            set_value(record, value if converter is None else converter(value))
+        for set_value, converter, default in defaults:
+            factory = getattr(default, 'factory', None)
+            if factory is not None:
+                default = factory(record) if default.takes_self else factory()
+            set_value(record, default if converter is None else converter(default))
+        if post_init is not None:
+            post_init(record)
+        return record
 
-        raise ValueError(f'{line!r} did not match {cls.__name__} record formats')
+    @classmethod
+    def _get_field_converters(cls, pattern: Pattern) -> _FieldConverters:
+        """Work out how :meth:`_from_match` fills in each field for ``pattern``."""
+        converters = []
+        defaults = []
+        for attribute in fields(cls):
+            set_value = _get_setter(cls, attribute.name)
+            index = pattern.groupindex.get(attribute.name.lstrip('_'))
+            if index is not None:
+                converters.append((index - 1, set_value, attribute.converter))
+            elif attribute.default is NOTHING:
+                raise TypeError(
+                    f'{cls.__name__} pattern has no group for required field {attribute.name!r}'
+                )
+            else:
+                defaults.append((set_value, attribute.converter, attribute.default))
+        return tuple(converters), tuple(defaults), getattr(cls, '__attrs_post_init__', None)
 
     @abstractmethod
     def to_ocr(self) -> str:
         """Get record as OCR string."""
 
 
+@_register
 @define
 class TransmissionStart(Record):
     """TransmissionStart is the first record in every OCR file.
@@ -95,10 +196,9 @@ class TransmissionStart(Record):
     data_recipient: str = field(validator=str_of_length(8))
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSMISSION_START
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '00': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>00)
             00      # Transmission type, always 00
@@ -109,20 +209,23 @@ class TransmissionStart(Record):
             (?P<data_recipient>\d{8})
 
             0{49}   # Padding
-            $
             ''',
-            re.VERBOSE,
-        )
-    ]
+            re.VERBOSE | re.ASCII,
+        ),
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
         return (
-            f'NY000010{self.data_transmitter:8}{self.transmission_number:7}{self.data_recipient:8}'
+            'NY000010'
+            f'{self.data_transmitter.ljust(8)}'
+            f'{self.transmission_number.ljust(7)}'
+            f'{self.data_recipient.ljust(8)}'
             + ('0' * 49)
         )
 
 
+@_register
 @define
 class TransmissionEnd(Record):
     """TransmissionEnd is the first record in every OCR file."""
@@ -133,10 +236,9 @@ class TransmissionEnd(Record):
     nets_date: 'datetime.date' = field(converter=to_date_or_none)
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSMISSION_END
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '00': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>00)
             00      # Transmission type, always 00
@@ -148,11 +250,10 @@ class TransmissionEnd(Record):
             (?P<nets_date>\d{6})
 
             0{33}   # Filler
-            $
             ''',
-            re.VERBOSE,
-        )
-    ]
+            re.VERBOSE | re.ASCII,
+        ),
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
@@ -161,11 +262,12 @@ class TransmissionEnd(Record):
             f'{self.num_transactions:08d}'
             f'{self.num_records:08d}'
             f'{self.total_amount:017d}'
-            f'{self.nets_date:%d%m%y}'
+            f'{_ddmmyy(self.nets_date)}'
             + ('0' * 33)
         )
 
 
+@_register
 @define
 class AssignmentStart(Record):
     """AssignmentStart is the first record of an assignment.
@@ -181,27 +283,28 @@ class AssignmentStart(Record):
     agreement_id: Optional[str] = field(default=None, validator=optional(str_of_length(9)))
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.ASSIGNMENT_START
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
-            r'''
-            ^
-            NY      # Format code
-            (?P<service_code>(09|21))
-            (?P<assignment_type>00)
-            20      # Record type
-
-            (?P<agreement_id>\d{9})
-            (?P<assignment_number>\d{7})
-            (?P<assignment_account>\d{11})
-
-            0{45}   # Filler
-            $
-            ''',
-            re.VERBOSE,
+    _PATTERN_KEY: ClassVar[slice] = slice(2, 6)
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        **dict.fromkeys(
+            ('0900', '2100'),
+            re.compile(
+                r'''
+                NY      # Format code
+                (?P<service_code>09|21)
+                (?P<assignment_type>00)
+                20      # Record type
+
+                (?P<agreement_id>\d{9})
+                (?P<assignment_number>\d{7})
+                (?P<assignment_account>\d{11})
+
+                0{45}   # Filler
+                ''',
+                re.VERBOSE | re.ASCII,
+            ),
         ),
-        re.compile(
+        '2124': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<assignment_type>24)
@@ -213,13 +316,11 @@ class AssignmentStart(Record):
             (?P<assignment_account>\d{11})
 
             0{45}   # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-        re.compile(
+        '2136': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<assignment_type>36)
@@ -231,22 +332,22 @@ class AssignmentStart(Record):
             (?P<assignment_account>\d{11})
 
             0{45}   # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-    ]
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
         return (
             f'NY{self.service_code:02d}{self.assignment_type:02d}20'
-            + (self.agreement_id and f'{self.agreement_id:9}' or ('0' * 9))
-            + f'{self.assignment_number:7}{self.assignment_account:11}'
+            + (self.agreement_id or '0' * 9).ljust(9)
+            + f'{self.assignment_number.ljust(7)}{self.assignment_account.ljust(11)}'
             + ('0' * 45)
         )
 
 
+@_register
 @define
 class AssignmentEnd(Record):
     """AssignmentEnd is the last record of an assignment."""
@@ -262,30 +363,31 @@ class AssignmentEnd(Record):
     nets_date_3: Optional['datetime.date'] = field(default=None, converter=to_date_or_none)
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.ASSIGNMENT_END
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
-            r'''
-            ^
-            NY      # Format code
-            (?P<service_code>(09|21))
-            (?P<assignment_type>00)     # Transactions / payment requests
-            88      # Record type
-
-            (?P<num_transactions>\d{8})
-            (?P<num_records>\d{8})
-            (?P<total_amount>\d{17})
-            (?P<nets_date_1>\d{6})
-            (?P<nets_date_2>\d{6})
-            (?P<nets_date_3>\d{6})
-
-            0{21}   # Filler
-            $
-            ''',
-            re.VERBOSE,
+    _PATTERN_KEY: ClassVar[slice] = slice(2, 6)
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        **dict.fromkeys(
+            ('0900', '2100'),
+            re.compile(
+                r'''
+                NY      # Format code
+                (?P<service_code>09|21)
+                (?P<assignment_type>00)     # Transactions / payment requests
+                88      # Record type
+
+                (?P<num_transactions>\d{8})
+                (?P<num_records>\d{8})
+                (?P<total_amount>\d{17})
+                (?P<nets_date_1>\d{6})
+                (?P<nets_date_2>\d{6})
+                (?P<nets_date_3>\d{6})
+
+                0{21}   # Filler
+                ''',
+                re.VERBOSE | re.ASCII,
+            ),
         ),
-        re.compile(
+        '2124': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<assignment_type>24)     # AvtaleGiro agreements
@@ -295,13 +397,11 @@ class AssignmentEnd(Record):
             (?P<num_records>\d{8})
 
             0{56}   # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-        re.compile(
+        '2136': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<assignment_type>36)     # AvtaleGiro cancellations
@@ -314,11 +414,10 @@ class AssignmentEnd(Record):
             (?P<nets_date_2>\d{6})
 
             0{27}   # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-    ]
+    }
 
     @property
     def nets_date(self) -> Optional['datetime.date']:
@@ -357,10 +456,10 @@ class AssignmentEnd(Record):
             '88'
             f'{self.num_transactions:08d}'
             f'{self.num_records:08d}'
-            + (self.total_amount and f'{self.total_amount:017d}' or ('0' * 17))
-            + (self.nets_date_1 and f'{self.nets_date_1:%d%m%y}' or ('0' * 6))
-            + (self.nets_date_2 and f'{self.nets_date_2:%d%m%y}' or ('0' * 6))
-            + (self.nets_date_3 and f'{self.nets_date_3:%d%m%y}' or ('0' * 6))
+            f'{self.total_amount or 0:017d}'
+            f'{_ddmmyy(self.nets_date_1)}'
+            f'{_ddmmyy(self.nets_date_2)}'
+            f'{_ddmmyy(self.nets_date_3)}'
             + ('0' * 21)
         )
 
@@ -373,6 +472,7 @@ class TransactionRecord(Record):
     transaction_number: int = field(converter=int)
 
 
+@_register
 @define
 class TransactionAmountItem1(TransactionRecord):
     """TransactionAmountItem1 is the first record of a transaction.
@@ -396,10 +496,9 @@ class TransactionAmountItem1(TransactionRecord):
     sign: Optional[str] = field(default=None, validator=optional(str_of_length(1)))
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSACTION_AMOUNT_ITEM_1
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '09': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>09)
             (?P<transaction_type>\d{2})  # 10-21
@@ -418,13 +517,11 @@ class TransactionAmountItem1(TransactionRecord):
             (?P<kid>[\d ]{25})
 
             0{6}    # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-        re.compile(
+        '21': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<transaction_type>\d{2})  # 02, 21, or 93
@@ -439,11 +536,10 @@ class TransactionAmountItem1(TransactionRecord):
             (?P<kid>[\d ]{25})
 
             0{6}    # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-    ]
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
@@ -464,13 +560,15 @@ class TransactionAmountItem1(TransactionRecord):
             f'{self.transaction_type:02d}'
             '30'
             f'{self.transaction_number:07d}'
-            f'{self.nets_date:%d%m%y}'
-            + ocr_giro_fields
-            + f'{self.amount:017d}{self.kid:>25}'
+            f'{_ddmmyy(self.nets_date)}'
+            f'{ocr_giro_fields}'
+            f'{self.amount:017d}'
+            f'{self.kid:>25}'
             + ('0' * 6)
         )
 
 
+@_register
 @define
 class TransactionAmountItem2(TransactionRecord):
     """TransactionAmountItem2 is the second record of a transaction.
@@ -493,10 +591,9 @@ class TransactionAmountItem2(TransactionRecord):
     payer_name: Optional[str] = field(default=None, converter=to_safe_str_or_none)
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSACTION_AMOUNT_ITEM_2
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '09': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>09)
             (?P<transaction_type>\d{2})  # 10-21
@@ -512,13 +609,11 @@ class TransactionAmountItem2(TransactionRecord):
             (?P<debit_account>\d{11})
 
             0{22}    # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-        re.compile(
+        '21': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<transaction_type>\d{2})  # 02, 21, or 93
@@ -532,11 +627,10 @@ class TransactionAmountItem2(TransactionRecord):
             (?P<reference>.{25})
 
             0{5}    # Filler
-            $
             ''',
-            re.VERBOSE,
+            re.VERBOSE | re.ASCII,
         ),
-    ]
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
@@ -546,17 +640,17 @@ class TransactionAmountItem2(TransactionRecord):
         if self.service_code == ServiceCode.OCR_GIRO:
             service_fields = (
                 f'{self.form_number:10}'
-                + (self.reference and f'{self.reference:9}' or (' ' * 9))
-                + (self._filler and f'{self._filler:7}' or ('0' * 7))
-                + (self.bank_date and f'{self.bank_date:%d%m%y}' or '0' * 6)
+                + (self.reference or '').ljust(9)
+                + (self._filler or '0' * 7).ljust(7)
+                + _ddmmyy(self.bank_date)
                 + f'{self.debit_account:11}'
                 + ('0' * 22)
             )
         elif self.service_code == ServiceCode.AVTALEGIRO:
             service_fields = (
-                (self.payer_name and f'{self.payer_name[:10]:10}' or (' ' * 10))
+                (self.payer_name or '')[:10].ljust(10)
                 + (' ' * 25)
-                + (self.reference and f'{self.reference:25}' or (' ' * 25))
+                + (self.reference or '').ljust(25)
                 + ('0' * 5)
             )
         else:  # pragma: no cover
@@ -565,6 +659,7 @@ class TransactionAmountItem2(TransactionRecord):
         return common_fields + service_fields
 
 
+@_register
 @define
 class TransactionAmountItem3(TransactionRecord):
     """TransactionAmountItem3 is the third record of a transaction.
@@ -577,10 +672,9 @@ class TransactionAmountItem3(TransactionRecord):
     )
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSACTION_AMOUNT_ITEM_3
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '09': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>09)
             (?P<transaction_type>\d{2})  # 20-21
@@ -590,21 +684,21 @@ class TransactionAmountItem3(TransactionRecord):
             (?P<text>.{40})
 
             0{25}    # Filler
-            $
             ''',
-            re.VERBOSE,
-        )
-    ]
+            re.VERBOSE | re.ASCII,
+        ),
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
         return (
             f'NY09{self.transaction_type:02d}32{self.transaction_number:07d}'
-            + (self.text and f'{self.text:40}' or (' ' * 40))
+            + (self.text or '').ljust(40)
             + ('0' * 25)
         )
 
 
+@_register
 @define
 class TransactionSpecification(TransactionRecord):
     """TransactionSpecification is used for AvtaleGiro transactions.
@@ -624,10 +718,9 @@ class TransactionSpecification(TransactionRecord):
     )
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSACTION_SPECIFICATION
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '21': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<transaction_type>21)
@@ -640,16 +733,16 @@ class TransactionSpecification(TransactionRecord):
             (?P<text>.{40})
 
             0{20}    # Filler
-            $
             ''',
-            re.VERBOSE,
-        )
-    ]
+            re.VERBOSE | re.ASCII,
+        ),
+    }
 
     _MAX_LINES = 42
     _MAX_LINE_LENGTH = 80
     _MAX_COLUMNS = 2
     _MAX_RECORDS = _MAX_LINES * _MAX_COLUMNS
+    _BLANK_COLUMN = ' ' * 40
 
     @classmethod
     def from_text(
@@ -686,8 +779,12 @@ class TransactionSpecification(TransactionRecord):
                     )
                 )
 
-            yield line_number, 1, f'{line_text[:40]:40}'
-            yield line_number, 2, f'{line_text[40:80]:40}'
+            if len(line_text) > 40:
+                yield line_number, 1, line_text[:40]
+                yield line_number, 2, f'{line_text[40:]:40}'
+            else:
+                yield line_number, 1, f'{line_text:40}'
+                yield line_number, 2, cls._BLANK_COLUMN
 
     @classmethod
     def to_text(cls, records: List['TransactionSpecification']) -> str:
@@ -697,16 +794,14 @@ class TransactionSpecification(TransactionRecord):
                 f'Max {cls._MAX_RECORDS} specification records allowed, got {len(records)}'
             )
 
-        tuples = sorted((r.line_number, r.column_number, r) for r in records)
-
-        text = ''
-        for _, column, specification in tuples:
+        parts: List[str] = []
+        for specification in sorted(records, key=attrgetter('line_number', 'column_number')):
             if specification.text:
-                text += specification.text
-                if column == cls._MAX_COLUMNS:
-                    text += '\n'
+                parts.append(specification.text)
+                if specification.column_number == cls._MAX_COLUMNS:
+                    parts.append('\n')
 
-        return text
+        return ''.join(parts)
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
@@ -721,6 +816,7 @@ class TransactionSpecification(TransactionRecord):
         )
 
 
+@_register
 @define
 class AvtaleGiroAgreement(TransactionRecord):
     """AvtaleGiroAgreement is used by Nets to notify about agreement changes.
@@ -738,10 +834,9 @@ class AvtaleGiroAgreement(TransactionRecord):
     notify: bool = field(converter=to_bool)
 
     RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSACTION_AGREEMENTS
-    _PATTERNS: ClassVar[List[Pattern]] = [
-        re.compile(
+    _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+        '21': re.compile(
             r'''
-            ^
             NY      # Format code
             (?P<service_code>21)
             (?P<transaction_type>94)
@@ -753,11 +848,10 @@ class AvtaleGiroAgreement(TransactionRecord):
             (?P<notify>[JN]{1})
 
             0{38}   # Filler
-            $
             ''',
-            re.VERBOSE,
-        )
-    ]
+            re.VERBOSE | re.ASCII,
+        ),
+    }
 
     def to_ocr(self) -> str:
         """Get record as OCR string."""
@@ -765,36 +859,32 @@ class AvtaleGiroAgreement(TransactionRecord):
             f'NY219470{self.transaction_number:07d}{self.registration_type:01d}{self.kid:>25}'
             + (self.notify and 'J' or 'N')
             + ('0' * 38)
-        ).format(self=self)
-
-
-def parse(data: str) -> List[R]:
-    """Parse an OCR file into a list of record objects."""
-
-    def all_subclasses(cls: Union[Type[R], Type[Record]]) -> List[Type[R]]:
-        """Return a list of subclasses for a given class."""
-        classes = cls.__subclasses__() + [
-            subsubcls for subcls in cls.__subclasses__() for subsubcls in all_subclasses(subcls)
-        ]
-        return cast(List[Type[R]], classes)
+        )
 
-    record_classes = {
-        cls.RECORD_TYPE: cls for cls in all_subclasses(Record) if hasattr(cls, 'RECORD_TYPE')
-    }
 
-    results: List[R] = []
+def iter_parse(data: str) -> Iterator[R]:
+    """Parse an OCR file, yielding a record object for each line.
 
+    Records are parsed as they are consumed, so the whole file never has to be
+    held as records at once. Errors in a line are raised when that line is
+    reached.
+    """
     for line in data.strip().splitlines():
         if len(line) != 80:
             raise ValueError('All lines must be exactly 80 chars long')
+        if not line.startswith('NY'):
+            raise ValueError(f"All lines must start with format code 'NY', got {line[:2]!r}")
 
         record_type_str = line[6:8]
-        if not record_type_str.isnumeric():
-            raise ValueError(f'Record type must be numeric, got {record_type_str!r}')
+        record_cls = _RECORD_CLASSES_BY_CODE.get(record_type_str)
+        if record_cls is None:
+            if not (record_type_str.isascii() and record_type_str.isdigit()):
+                raise ValueError(f'Record type must be numeric, got {record_type_str!r}')
+            record_cls = _RECORD_CLASSES[to_record_type(record_type_str)]
 
-        record_type = to_record_type(record_type_str)
-        record_cls = record_classes[record_type]
+        yield cast(R, record_cls.from_string(line))
 
-        results.append(record_cls.from_string(line))
 
-    return results
+def parse(data: str) -> List[R]:
+    """Parse an OCR file into a list of record objects."""
+    return list(iter_parse(data))
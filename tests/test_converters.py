@@ -1,6 +1,15 @@
+import datetime
+
 import pytest
 
-from netsgiro.converters import to_bool, truthy_or_none, value_or_none
+from netsgiro.converters import (
+    to_bool,
+    to_date,
+    to_date_or_none,
+    to_safe_str_or_none,
+    truthy_or_none,
+    value_or_none,
+)
 
 values = [
     (int, None, None, None),
@@ -31,3 +40,41 @@ def test_to_bool():
     for v in [None, 'S', '', [], {}]:
         with pytest.raises(ValueError, match="Expected 'J' or 'N', got "):
             to_bool(v)
+
+
+@pytest.mark.parametrize('value', ['010170', '311299', '290200', '150668', '010169', '280292'])
+def test_to_date_matches_strptime(value):
+    expected = datetime.datetime.strptime(value, '%d%m%y').date()
+    assert to_date(value) == expected
+    assert to_date_or_none(value) == expected
+
+
+def test_to_date_or_none():
+    assert to_date_or_none(None) is None
+    assert to_date_or_none('000000') is None
+    assert to_date_or_none(datetime.date(2022, 11, 4)) == datetime.date(2022, 11, 4)
+
+
+@pytest.mark.parametrize(
+    'value', ['320199', '011399', '01019', '0101990', '01 199', '+10199', '٠١٠١٧٠']
+)
+def test_to_date_invalid(value):
+    with pytest.raises(ValueError):
+        to_date(value)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        (None, None),
+        ('', None),
+        (' ' * 25, None),
+        ('1234567890', '1234567890'),
+        ('  12345  ', '12345'),
+        ('foo\r\nbar', 'foobar'),
+        (' \n foo bar \r\n', 'foo bar'),
+        ('\r\n', None),
+    ],
+)
+def test_to_safe_str_or_none(value, expected):
+    assert to_safe_str_or_none(value) == expected
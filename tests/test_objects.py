@@ -1,10 +1,12 @@
 from datetime import date
+from decimal import Decimal
 
+import attrs
 import pytest
 
 import netsgiro
 from netsgiro.objects import Transmission
-from netsgiro.records import AssignmentEnd
+from netsgiro.records import AssignmentEnd, TransactionAmountItem1, TransmissionEnd
 
 
 @pytest.fixture
@@ -36,3 +38,207 @@ def test_transmission__get_assignments_validation():
     for item in ['test', assignment_end]:
         with pytest.raises(ValueError, match='Expected AssignmentStart record, got '):
             Transmission._get_assignments([item])
+
+
+def test_payment_request_amount_in_cents_follows_amount():
+    payment_request = netsgiro.PaymentRequest(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        type=netsgiro.TransactionType.AVTALEGIRO_WITH_PAYEE_NOTIFICATION,
+        number=1,
+        date=date(2004, 6, 17),
+        amount='5244.63',
+        kid='000133700501645',
+        reference=None,
+        text=None,
+        payer_name=None,
+    )
+
+    assert payment_request.amount_in_cents == 524463
+
+    payment_request.amount = '475.55'
+
+    assert payment_request.amount == Decimal('475.55')
+    assert payment_request.amount_in_cents == 47555
+
+
+def test_payment_request_serializes_only_public_fields():
+    payment_request = netsgiro.PaymentRequest(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        type=netsgiro.TransactionType.AVTALEGIRO_WITH_PAYEE_NOTIFICATION,
+        number=1,
+        date=date(2004, 6, 17),
+        amount='5244.63',
+        kid='000133700501645',
+        reference=None,
+        text=None,
+        payer_name=None,
+    )
+
+    assert list(attrs.asdict(payment_request)) == [
+        'service_code',
+        'type',
+        'number',
+        'date',
+        'amount',
+        'kid',
+        'reference',
+        'text',
+        'payer_name',
+    ]
+
+
+def test_assignment_transaction_dates_follow_reassigned_dates():
+    assignment = netsgiro.Assignment(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        type=netsgiro.AssignmentType.TRANSACTIONS,
+        number='0323001',
+        account='15035382752',
+    )
+    first = assignment.add_payment_request(
+        kid='000133700501645', due_date=date(2017, 4, 6), amount=Decimal('5244.63')
+    )
+    assignment.add_payment_request(
+        kid='001054300504897', due_date=date(2017, 4, 8), amount=Decimal('475.55')
+    )
+
+    first.date = date(2017, 4, 10)
+
+    assert assignment.get_earliest_transaction_date() == date(2017, 4, 8)
+    assert assignment.get_latest_transaction_date() == date(2017, 4, 10)
+
+
+def test_assignment_aggregates_follow_added_transactions():
+    assignment = netsgiro.Assignment(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        type=netsgiro.AssignmentType.TRANSACTIONS,
+        number='0323001',
+        account='15035382752',
+    )
+    first = assignment.add_payment_request(
+        kid='000133700501645', due_date=date(2017, 4, 6), amount=Decimal('5244.63')
+    )
+
+    assert assignment.get_total_amount() == Decimal('5244.63')
+    assert assignment.get_num_records() == 4
+    assert assignment.get_latest_transaction_date() == date(2017, 4, 6)
+
+    assignment.add_payment_request(
+        kid='001054300504897',
+        due_date=date(2017, 4, 8),
+        amount=Decimal('475.55'),
+        bank_notification='Foo bar',
+    )
+
+    assert assignment.get_total_amount() == Decimal('5720.18')
+    assert assignment.get_num_records() == 8
+    assert assignment.get_latest_transaction_date() == date(2017, 4, 8)
+
+    assignment.transactions.remove(first)
+
+    assert assignment.get_total_amount() == Decimal('475.55')
+    assert assignment.get_num_records() == 6
+    assert assignment.get_earliest_transaction_date() == date(2017, 4, 8)
+
+
+@pytest.mark.parametrize(
+    'amounts, expected',
+    [
+        (['100.00', '50.00'], '150.00'),
+        (['10.005', '10.005'], '20.010'),
+    ],
+)
+def test_total_amount_keeps_decimal_precision(transmission, amounts, expected):
+    assignment = transmission.add_assignment(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        assignment_type=netsgiro.AssignmentType.TRANSACTIONS,
+        number='0323001',
+        account='15035382752',
+    )
+    for i, amount in enumerate(amounts):
+        assignment.add_payment_request(
+            kid=f'00013370050164{i}', due_date=date(2017, 4, 6), amount=Decimal(amount)
+        )
+
+    assert str(assignment.get_total_amount()) == expected
+    assert str(transmission.get_total_amount()) == expected
+
+
+def test_end_records_total_the_written_item_amounts(transmission):
+    assignment = transmission.add_assignment(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        assignment_type=netsgiro.AssignmentType.TRANSACTIONS,
+        number='0323001',
+        account='15035382752',
+    )
+    for i in range(2):
+        assignment.add_payment_request(
+            kid=f'00013370050164{i}', due_date=date(2017, 4, 6), amount=Decimal('10.005')
+        )
+
+    records = list(transmission.to_records())
+
+    # Each item is written as 1000 cents, so the end records total 2000
+    # rather than the 2001 cents the rounded Decimal sum would give.
+    item_amounts = [r.amount for r in records if isinstance(r, TransactionAmountItem1)]
+    assert item_amounts == [1000, 1000]
+    assignment_end, transmission_end = records[-2:]
+    assert isinstance(assignment_end, AssignmentEnd)
+    assert isinstance(transmission_end, TransmissionEnd)
+    assert assignment_end.total_amount == 2000
+    assert transmission_end.total_amount == 2000
+
+
+def test_assignment_end_follows_changed_transactions(transmission):
+    assignment = transmission.add_assignment(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        assignment_type=netsgiro.AssignmentType.TRANSACTIONS,
+        number='0323001',
+        account='15035382752',
+    )
+    first = assignment.add_payment_request(
+        kid='000133700501645', due_date=date(2017, 4, 6), amount=Decimal('100.00')
+    )
+    second = assignment.add_payment_request(
+        kid='001054300504897',
+        due_date=date(2017, 4, 8),
+        amount=Decimal('50.00'),
+        bank_notification='Foo bar',
+    )
+
+    # Read every aggregate before changing anything
+    transmission.to_ocr()
+    assert assignment.get_total_amount() == Decimal('150.00')
+    assert assignment.get_num_records() == 8
+    assert assignment.get_latest_transaction_date() == date(2017, 4, 8)
+
+    first.amount = Decimal('999.00')
+    first.date = date(2017, 4, 10)
+    second.text = 'Foo\nbar'
+
+    assert assignment.get_total_amount() == Decimal('1049.00')
+    assert assignment.get_num_records() == 10
+    assert assignment.get_latest_transaction_date() == date(2017, 4, 10)
+
+    assignment.transactions[1] = netsgiro.PaymentRequest(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        type=netsgiro.TransactionType.AVTALEGIRO_WITH_PAYEE_NOTIFICATION,
+        number=2,
+        date=date(2017, 4, 2),
+        amount=Decimal('1.00'),
+        kid='001054300504897',
+        reference=None,
+        text=None,
+        payer_name=None,
+    )
+
+    records = netsgiro.records.parse(transmission.to_ocr())
+    assignment_end = records[-2]
+    transmission_end = records[-1]
+
+    assert isinstance(assignment_end, AssignmentEnd)
+    assert assignment_end.total_amount == 100000
+    assert assignment_end.num_records == 6
+    assert assignment_end.nets_date_1 == date(2017, 4, 2)
+    assert assignment_end.nets_date_2 == date(2017, 4, 10)
+    assert transmission_end.total_amount == 100000
+    assert transmission_end.num_records == 8
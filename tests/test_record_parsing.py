@@ -1,7 +1,9 @@
+import re
 from datetime import date
-from typing import List
+from typing import ClassVar, Dict, List, Pattern
 
 import pytest
+from attrs import define, field
 
 from netsgiro import (
     AssignmentType,
@@ -47,6 +49,20 @@ def test_transmission_start_fails_when_invalid_format():
         TransmissionStart.from_string(line)
 
 
+@pytest.mark.parametrize(
+    'line',
+    [
+        # Non-ASCII digits in the data transmitter field
+        'NY000010\u06655555555100008100008080' + ('0' * 49),
+        # Trailing newline
+        'NY000010555555551000081000080800000000000000000000000000000000000000000000000000\n',
+    ],
+)
+def test_transmission_start_fails_when_not_exact_ascii_line(line):
+    with pytest.raises(ValueError, match='did not match TransmissionStart record format'):
+        TransmissionStart.from_string(line)
+
+
 def test_transmission_end():
     record = TransmissionEnd.from_string(
         'NY000089000000060000002200000000000000600170604000000000000000000000000000000000'
@@ -432,3 +448,79 @@ def test_record__to_ocr():
         match="Can't instantiate abstract class SomeRecordDerivative with abstract method",
     ):
         SomeRecordDerivative()
+
+
+def test_record_fields_without_pattern_group_get_their_defaults():
+    @define
+    class RecordWithDefaults(Record):
+        name: str
+        note: str = field(default='foo')
+        tags: List[str] = field(factory=list)
+
+        RECORD_TYPE: ClassVar[RecordType] = RecordType.TRANSMISSION_START
+        _PATTERNS: ClassVar[Dict[str, Pattern]] = {
+            '00': re.compile(r'NY(?P<service_code>00)10(?P<name>.{74})'),
+        }
+
+        def to_ocr(self) -> str:
+            return f'NY0010{self.name}'
+
+    line = 'NY0010' + 'x' * 74
+    record = RecordWithDefaults.from_string(line)
+    other = RecordWithDefaults.from_string(line)
+
+    assert record == RecordWithDefaults(service_code='00', name='x' * 74)
+    assert record.note == 'foo'
+    assert record.tags == []
+    assert record.tags is not other.tags
+
+
+@pytest.mark.parametrize('subclass_first', [True, False])
+def test_record_subclass_sharing_patterns_with_parent(subclass_first):
+    @define
+    class TransmissionStartWithExtra(TransmissionStart):
+        extra: str = field(default='foo')
+
+    line = 'NY000010555555551000081000080800000000000000000000000000000000000000000000000000'
+    classes = [TransmissionStartWithExtra, TransmissionStart]
+    if not subclass_first:
+        classes.reverse()
+    for cls in classes:
+        cls.from_string(line)
+
+    parent = TransmissionStart.from_string(line)
+    record = TransmissionStartWithExtra.from_string(line)
+
+    assert type(parent) is TransmissionStart
+    assert type(record) is TransmissionStartWithExtra
+    assert record.extra == 'foo'
+    assert record.transmission_number == parent.transmission_number == '1000081'
+
+
+def test_record_subclass_without_slots():
+    @define(slots=False)
+    class TransmissionStartWithoutSlots(TransmissionStart):
+        extra: str = field(default='foo')
+
+    record = TransmissionStartWithoutSlots.from_string(
+        'NY000010555555551000081000080800000000000000000000000000000000000000000000000000'
+    )
+
+    assert record.extra == 'foo'
+    assert record.transmission_number == '1000081'
+    assert record.__dict__ == {'extra': 'foo'}
+
+
+def test_record_subclass_post_init_runs_when_parsing():
+    @define
+    class TransmissionStartWithPostInit(TransmissionStart):
+        seen: bool = field(default=False)
+
+        def __attrs_post_init__(self) -> None:
+            self.seen = True
+
+    record = TransmissionStartWithPostInit.from_string(
+        'NY000010555555551000081000080800000000000000000000000000000000000000000000000000'
+    )
+
+    assert record.seen is True
@@ -58,6 +58,27 @@ def test_transmission_end():
     )
 
 
+def test_transmission_end_without_nets_date():
+    line = 'NY000089000000060000002200000000000000600000000000000000000000000000000000000000'
+    record = netsgiro.records.TransmissionEnd.from_string(line)
+
+    assert record.nets_date is None
+    assert record.to_ocr() == line
+
+
+@pytest.mark.parametrize('nets_date', [date(1969, 1, 1), date(1999, 12, 31), date(2068, 2, 29)])
+def test_transmission_end_nets_date_format(nets_date):
+    record = netsgiro.records.TransmissionEnd(
+        service_code=netsgiro.ServiceCode.NONE,
+        num_transactions=6,
+        num_records=22,
+        total_amount=600,
+        nets_date=nets_date,
+    )
+
+    assert record.to_ocr()[41:47] == nets_date.strftime('%d%m%y')
+
+
 @pytest.mark.parametrize(
     'num_tx, num_records, total_amount, nets_date, exc',
     [
@@ -198,6 +219,20 @@ def test_transaction_amount_item_1_for_avtalegiro_payment_requests():
     )
 
 
+def test_transaction_amount_item_1_to_ocr_fails_without_kid():
+    record = netsgiro.records.TransactionAmountItem1(
+        service_code=netsgiro.ServiceCode.AVTALEGIRO,
+        transaction_type=netsgiro.TransactionType.AVTALEGIRO_WITH_BANK_NOTIFICATION,
+        transaction_number=1,
+        nets_date=date(2004, 6, 17),
+        amount=100,
+        kid=None,
+    )
+
+    with pytest.raises(TypeError):
+        record.to_ocr()
+
+
 def test_transaction_amount_item_1_raises_if_kid_is_too_long():
     with pytest.raises(ValueError, match='kid must be at most 25 chars'):
         netsgiro.records.TransactionAmountItem1(
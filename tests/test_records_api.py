@@ -11,9 +11,15 @@ def test_parse_with_too_short_lines_fails():
         netsgiro.records.parse('NY0000\nNY0000\n')
 
 
-def test_parse_with_nonnumeric_record_type():
-    with pytest.raises(ValueError, match="Record type must be numeric, got 'AA'"):
-        netsgiro.records.parse('NY0000AA' + '0' * 72)
+def test_parse_with_wrong_format_code():
+    with pytest.raises(ValueError, match="must start with format code 'NY', got 'XX'"):
+        netsgiro.records.parse('XX000010' + '0' * 72)
+
+
+@pytest.mark.parametrize('record_type', ['AA', '\u0663\u0663', '\u00bd0'])
+def test_parse_with_nonnumeric_record_type(record_type):
+    with pytest.raises(ValueError, match=f'Record type must be numeric, got {record_type!r}'):
+        netsgiro.records.parse('NY0000' + record_type + '0' * 72)
 
 
 def test_parse_with_unknown_record_type():
@@ -21,6 +27,28 @@ def test_parse_with_unknown_record_type():
         netsgiro.records.parse('NY000099' + '0' * 72)
 
 
+@pytest.mark.parametrize('newline', ['\r\n', '\r'])
+def test_parse_with_other_line_endings(agreements_data, newline):
+    data = agreements_data.replace('\n', newline)
+
+    assert netsgiro.records.parse(data) == netsgiro.records.parse(agreements_data)
+
+
+def test_parse_with_mixed_line_endings(agreements_data):
+    lines = agreements_data.splitlines()
+    data = '\r'.join(lines[:5]) + '\n' + '\r\n'.join(lines[5:])
+
+    assert netsgiro.records.parse(data) == netsgiro.records.parse(agreements_data)
+
+
+def test_parse_with_blank_line_fails(agreements_data):
+    lines = agreements_data.splitlines()
+    data = '\n'.join(lines[:2] + [''] + lines[2:])
+
+    with pytest.raises(ValueError, match='exactly 80 chars long'):
+        netsgiro.records.parse(data)
+
+
 def test_parse_avtalegiro_agreements(agreements_data):
     result = netsgiro.records.parse(agreements_data)
 
@@ -166,3 +194,19 @@ def test_parse_ocr_giro_transactions(ocr_giro_transactions_data):
     assert transmission_end.num_records == 45
     assert transmission_end.total_amount == 5144900
     assert transmission_end.nets_date == date(1992, 1, 20)
+
+
+def test_iter_parse_yields_same_records_as_parse(payment_request_data):
+    records = netsgiro.records.iter_parse(payment_request_data)
+
+    assert not isinstance(records, list)
+    assert list(records) == netsgiro.records.parse(payment_request_data)
+
+
+def test_iter_parse_raises_when_bad_line_is_reached(payment_request_data):
+    data = payment_request_data.strip() + '\nNY0000\n'
+    records = netsgiro.records.iter_parse(data)
+
+    assert isinstance(next(records), netsgiro.records.TransmissionStart)
+    with pytest.raises(ValueError, match='exactly 80 chars long'):
+        list(records)